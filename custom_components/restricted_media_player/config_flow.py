@@ -12,8 +12,11 @@ from homeassistant.core import callback
 from homeassistant.helpers import selector
 
 from .const import (
+    BLOCKABLE_COMMANDS,
     CONF_ALLOWED_SOURCES,
     CONF_BASE_ENTITY,
+    CONF_BLOCKED_COMMANDS,
+    CONF_ENTITIES,
     CONF_NAME,
     DOMAIN,
 )
@@ -21,6 +24,18 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def _blocked_commands_selector() -> selector.SelectSelector:
+    """Return the selector for commands to block."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=BLOCKABLE_COMMANDS,
+            multiple=True,
+            mode=selector.SelectSelectorMode.LIST,
+            translation_key=CONF_BLOCKED_COMMANDS,
+        ),
+    )
+
+
 class RestrictedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Restricted Media Player."""
 
@@ -30,11 +45,19 @@ class RestrictedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._base_entity_id: str | None = None
         self._base_entity_name: str | None = None
+        self._site_name: str | None = None
+        self._site_entity_ids: list[str] = []
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.FlowResult:
-        """Handle the initial step - select base media player."""
+        """Handle the initial step - choose a single player or a whole site."""
+        return self.async_show_menu(step_id="user", menu_options=["player", "site"])
+
+    async def async_step_player(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Handle selecting the base media player."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -58,7 +81,7 @@ class RestrictedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="player",
             data_schema=data_schema,
             errors=errors,
         )
@@ -74,6 +97,7 @@ class RestrictedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data = {
                 CONF_BASE_ENTITY: self._base_entity_id,
                 CONF_ALLOWED_SOURCES: user_input[CONF_ALLOWED_SOURCES],
+                CONF_BLOCKED_COMMANDS: user_input.get(CONF_BLOCKED_COMMANDS, []),
                 CONF_NAME: user_input.get(CONF_NAME, f"Restricted {self._base_entity_name}"),
             }
 
@@ -105,6 +129,9 @@ class RestrictedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         mode=selector.SelectSelectorMode.LIST,
                     ),
                 ),
+                vol.Optional(
+                    CONF_BLOCKED_COMMANDS, default=[]
+                ): _blocked_commands_selector(),
             }
         )
 
@@ -117,6 +144,107 @@ class RestrictedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    async def async_step_site(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Handle selecting the base media players of a site."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            self._site_name = user_input[CONF_NAME]
+            self._site_entity_ids = user_input[CONF_ENTITIES]
+            return await self.async_step_site_sources()
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_NAME): selector.TextSelector(),
+                vol.Required(CONF_ENTITIES): selector.EntitySelector(
+                    selector.EntitySelectorConfig(
+                        domain=MEDIA_PLAYER_DOMAIN,
+                        multiple=True,
+                    ),
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="site",
+            data_schema=data_schema,
+            errors=errors,
+        )
+
+    async def async_step_site_sources(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Handle selecting the sources allowed across a site."""
+        errors: dict[str, str] = {}
+
+        states = {
+            entity_id: self.hass.states.get(entity_id)
+            for entity_id in self._site_entity_ids
+        }
+        if not all(states.values()):
+            return self.async_abort(reason="cannot_connect")
+
+        # Offer every source that any of the base players knows about
+        source_list: list[str] = []
+        for state in states.values():
+            for source in state.attributes.get("source_list") or []:
+                if source not in source_list:
+                    source_list.append(source)
+
+        if not source_list:
+            return self.async_abort(reason="no_sources")
+
+        if user_input is not None:
+            rows = []
+            for entity_id, state in states.items():
+                base_sources = state.attributes.get("source_list") or []
+                base_name = state.attributes.get("friendly_name", entity_id)
+                rows.append(
+                    {
+                        CONF_BASE_ENTITY: entity_id,
+                        # Only keep the sources this base player can select
+                        CONF_ALLOWED_SOURCES: [
+                            s for s in user_input[CONF_ALLOWED_SOURCES] if s in base_sources
+                        ],
+                        CONF_NAME: f"Restricted {base_name}",
+                    }
+                )
+
+            return self.async_create_entry(
+                title=self._site_name,
+                data={
+                    CONF_NAME: self._site_name,
+                    CONF_BLOCKED_COMMANDS: user_input.get(CONF_BLOCKED_COMMANDS, []),
+                    CONF_ENTITIES: rows,
+                },
+            )
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_ALLOWED_SOURCES): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=source_list,
+                        multiple=True,
+                        mode=selector.SelectSelectorMode.LIST,
+                    ),
+                ),
+                vol.Optional(
+                    CONF_BLOCKED_COMMANDS, default=[]
+                ): _blocked_commands_selector(),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="site_sources",
+            data_schema=data_schema,
+            errors=errors,
+            description_placeholders={
+                "site": self._site_name,
+            },
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -129,10 +257,17 @@ class RestrictedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for Restricted Media Player."""
 
+    def __init__(self) -> None:
+        """Initialize the options flow."""
+        self._row_base_entity_id: str | None = None
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.FlowResult:
         """Manage the options."""
+        if CONF_ENTITIES in self.config_entry.data:
+            return await self.async_step_site()
+
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -140,6 +275,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 # Update the config entry with new allowed sources
                 new_data = {**self.config_entry.data}
                 new_data[CONF_ALLOWED_SOURCES] = user_input[CONF_ALLOWED_SOURCES]
+                new_data[CONF_BLOCKED_COMMANDS] = user_input.get(CONF_BLOCKED_COMMANDS, [])
 
                 self.hass.config_entries.async_update_entry(
                     self.config_entry,
@@ -204,6 +340,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             mode=selector.SelectSelectorMode.LIST,
                         ),
                     ),
+                    vol.Optional(
+                        CONF_BLOCKED_COMMANDS,
+                        default=self.config_entry.data.get(CONF_BLOCKED_COMMANDS, []),
+                    ): _blocked_commands_selector(),
                 }
             )
 
@@ -215,3 +355,188 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         except Exception as err:
             _LOGGER.exception("Unexpected error in options flow: %s", err)
             return self.async_abort(reason="unknown")
+
+    async def async_step_site(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Manage the rows of a site."""
+        return self.async_show_menu(
+            step_id="site",
+            menu_options=["edit_row", "add_row", "remove_row", "blocked_commands"],
+        )
+
+    def _row_options(self) -> list[selector.SelectOptionDict]:
+        """Return the rows of the site as select options."""
+        return [
+            selector.SelectOptionDict(value=row[CONF_BASE_ENTITY], label=row[CONF_NAME])
+            for row in self.config_entry.data[CONF_ENTITIES]
+        ]
+
+    @callback
+    def _async_update_rows(self, rows: list[dict[str, Any]]) -> config_entries.FlowResult:
+        """Store the updated rows on the config entry."""
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={**self.config_entry.data, CONF_ENTITIES: rows},
+        )
+        return self.async_create_entry(title="", data={})
+
+    async def async_step_edit_row(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Select the row to edit."""
+        if user_input is not None:
+            self._row_base_entity_id = user_input[CONF_BASE_ENTITY]
+            return await self.async_step_row_sources()
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_BASE_ENTITY): selector.SelectSelector(
+                    selector.SelectSelectorConfig(options=self._row_options()),
+                ),
+            }
+        )
+
+        return self.async_show_form(step_id="edit_row", data_schema=data_schema)
+
+    async def async_step_add_row(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Select the base media player of a new row."""
+        if user_input is not None:
+            self._row_base_entity_id = user_input[CONF_BASE_ENTITY]
+            return await self.async_step_row_sources()
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_BASE_ENTITY): selector.EntitySelector(
+                    selector.EntitySelectorConfig(
+                        domain=MEDIA_PLAYER_DOMAIN,
+                        exclude_entities=[
+                            row[CONF_BASE_ENTITY]
+                            for row in self.config_entry.data[CONF_ENTITIES]
+                        ],
+                    ),
+                ),
+            }
+        )
+
+        return self.async_show_form(step_id="add_row", data_schema=data_schema)
+
+    async def async_step_remove_row(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Select the rows to remove."""
+        if user_input is not None:
+            return self._async_update_rows(
+                [
+                    row
+                    for row in self.config_entry.data[CONF_ENTITIES]
+                    if row[CONF_BASE_ENTITY] not in user_input[CONF_ENTITIES]
+                ]
+            )
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_ENTITIES): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=self._row_options(),
+                        multiple=True,
+                        mode=selector.SelectSelectorMode.LIST,
+                    ),
+                ),
+            }
+        )
+
+        return self.async_show_form(step_id="remove_row", data_schema=data_schema)
+
+    async def async_step_blocked_commands(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Select the commands blocked across the site."""
+        if user_input is not None:
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                data={
+                    **self.config_entry.data,
+                    CONF_BLOCKED_COMMANDS: user_input.get(CONF_BLOCKED_COMMANDS, []),
+                },
+            )
+            return self.async_create_entry(title="", data={})
+
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_BLOCKED_COMMANDS,
+                    default=self.config_entry.data.get(CONF_BLOCKED_COMMANDS, []),
+                ): _blocked_commands_selector(),
+            }
+        )
+
+        return self.async_show_form(step_id="blocked_commands", data_schema=data_schema)
+
+    async def async_step_row_sources(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.FlowResult:
+        """Select the allowed sources of a single row."""
+        current = next(
+            (
+                row
+                for row in self.config_entry.data[CONF_ENTITIES]
+                if row[CONF_BASE_ENTITY] == self._row_base_entity_id
+            ),
+            None,
+        )
+
+        state = self.hass.states.get(self._row_base_entity_id)
+        if not state:
+            _LOGGER.error("Base entity %s not found", self._row_base_entity_id)
+            return self.async_abort(reason="cannot_connect")
+
+        source_list = state.attributes.get("source_list")
+        if not source_list or not isinstance(source_list, list):
+            return self.async_abort(reason="no_sources")
+
+        if user_input is not None:
+            base_name = state.attributes.get("friendly_name", self._row_base_entity_id)
+            new_row = {
+                CONF_BASE_ENTITY: self._row_base_entity_id,
+                CONF_ALLOWED_SOURCES: user_input[CONF_ALLOWED_SOURCES],
+                CONF_NAME: current[CONF_NAME] if current else f"Restricted {base_name}",
+            }
+
+            # Replace the row in place so the table keeps its order
+            rows = [
+                new_row if row is current else row
+                for row in self.config_entry.data[CONF_ENTITIES]
+            ]
+            if current is None:
+                rows.append(new_row)
+            return self._async_update_rows(rows)
+
+        current_sources = current[CONF_ALLOWED_SOURCES] if current else []
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_ALLOWED_SOURCES,
+                    default=[s for s in current_sources if s in source_list],
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=source_list,
+                        multiple=True,
+                        mode=selector.SelectSelectorMode.LIST,
+                    ),
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="row_sources",
+            data_schema=data_schema,
+            description_placeholders={
+                "base_entity": state.attributes.get(
+                    "friendly_name", self._row_base_entity_id
+                ),
+            },
+        )
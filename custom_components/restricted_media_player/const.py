@@ -4,4 +4,26 @@ DOMAIN = "restricted_media_player"
 CONF_BASE_ENTITY = "base_entity"
 CONF_ALLOWED_SOURCES = "allowed_sources"
 CONF_NAME = "name"
+CONF_ENTITIES = "entities"
+CONF_BLOCKED_COMMANDS = "blocked_commands"
 TECHNICIAN_MODE_SOURCE = "Technician Mode"
+
+# Commands that can be blocked, named after their MediaPlayerEntityFeature
+BLOCKABLE_COMMANDS = [
+    "turn_on",
+    "turn_off",
+    "volume_set",
+    "volume_step",
+    "volume_mute",
+    "play",
+    "pause",
+    "stop",
+    "next_track",
+    "previous_track",
+    "seek",
+    "play_media",
+]
+
+SERVICE_PROFILE = "profile"
+ATTR_DURATION = "duration"
+ATTR_CPROFILE = "cprofile"
@@ -1,16 +1,21 @@
 """Restricted Media Player entity implementation."""
 from __future__ import annotations
 
+from collections.abc import Callable
 import logging
 from typing import Any
 
 from homeassistant.components.media_player import (
+    DOMAIN as MEDIA_PLAYER_DOMAIN,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.const import (
@@ -22,7 +27,10 @@ from homeassistant.const import (
 from .const import (
     CONF_ALLOWED_SOURCES,
     CONF_BASE_ENTITY,
+    CONF_BLOCKED_COMMANDS,
+    CONF_ENTITIES,
     CONF_NAME,
+    DOMAIN,
     TECHNICIAN_MODE_SOURCE,
 )
 
@@ -35,16 +43,133 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Restricted Media Player from a config entry."""
+    if CONF_ENTITIES in config_entry.data:
+        site = RestrictedMediaPlayerSite(hass, config_entry, async_add_entities)
+        hass.data[DOMAIN][config_entry.entry_id] = site
+        site.async_setup()
+        return
+
     base_entity_id = config_entry.data[CONF_BASE_ENTITY]
     allowed_sources = config_entry.data[CONF_ALLOWED_SOURCES]
     name = config_entry.data[CONF_NAME]
+    blocked_commands = config_entry.data.get(CONF_BLOCKED_COMMANDS, [])
 
     async_add_entities(
-        [RestrictedMediaPlayer(hass, config_entry, base_entity_id, allowed_sources, name)],
+        [
+            RestrictedMediaPlayer(
+                hass,
+                config_entry,
+                base_entity_id,
+                allowed_sources,
+                name,
+                blocked_commands=blocked_commands,
+            )
+        ],
         True,
     )
 
 
+class RestrictedMediaPlayerSite:
+    """Restricted Media Players for the rows of a site config entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Initialize the site."""
+        self.hass = hass
+        self._config_entry = config_entry
+        self._async_add_entities = async_add_entities
+        self._blocked_commands = config_entry.data.get(CONF_BLOCKED_COMMANDS, [])
+        self._rows: dict[str, dict[str, Any]] = {}
+        self._entities: dict[str, RestrictedMediaPlayer] = {}
+
+    @callback
+    def _async_create_entity(self, row: dict[str, Any]) -> RestrictedMediaPlayer:
+        """Create the entity for a single row."""
+        base_entity_id = row[CONF_BASE_ENTITY]
+        self._rows[base_entity_id] = row
+        self._entities[base_entity_id] = RestrictedMediaPlayer(
+            self.hass,
+            self._config_entry,
+            base_entity_id,
+            row[CONF_ALLOWED_SOURCES],
+            row[CONF_NAME],
+            unique_id=f"{self._config_entry.entry_id}_{base_entity_id}",
+            device_name=self._config_entry.data[CONF_NAME],
+            blocked_commands=self._blocked_commands,
+        )
+        return self._entities[base_entity_id]
+
+    @callback
+    def async_setup(self) -> None:
+        """Add the entities for every row in one call."""
+        self._async_add_entities(
+            [
+                self._async_create_entity(row)
+                for row in self._config_entry.data[CONF_ENTITIES]
+            ],
+            True,
+        )
+
+    async def async_update(self, entry: ConfigEntry) -> None:
+        """Apply row changes to the affected entities only."""
+        blocked_commands = entry.data.get(CONF_BLOCKED_COMMANDS, [])
+        if blocked_commands != self._blocked_commands:
+            self._blocked_commands = blocked_commands
+            # Mask every entity before writing any state so that a failed
+            # write cannot leave part of the site with the old mask
+            for entity in self._entities.values():
+                entity.async_set_blocked_commands(blocked_commands)
+            for entity in self._entities.values():
+                if _entity_added(entity):
+                    entity.async_write_ha_state()
+
+        new_rows = {row[CONF_BASE_ENTITY]: row for row in entry.data[CONF_ENTITIES]}
+        entity_registry = er.async_get(self.hass)
+
+        for base_entity_id in self._rows.keys() - new_rows.keys():
+            self._rows.pop(base_entity_id)
+            entity = self._entities.pop(base_entity_id)
+            # Disabled or renamed entities are only found by their unique ID
+            if registry_entity_id := entity_registry.async_get_entity_id(
+                MEDIA_PLAYER_DOMAIN, DOMAIN, entity.unique_id
+            ):
+                entity_registry.async_remove(registry_entity_id)
+            elif _entity_added(entity):
+                await entity.async_remove()
+
+        new_entities = []
+        for base_entity_id, row in new_rows.items():
+            if base_entity_id not in self._rows:
+                new_entities.append(self._async_create_entity(row))
+            elif row != self._rows[base_entity_id]:
+                self._rows[base_entity_id] = row
+                self._entities[base_entity_id].async_set_allowed_sources(
+                    row[CONF_ALLOWED_SOURCES]
+                )
+
+        if new_entities:
+            self._async_add_entities(new_entities, True)
+
+
+def _entity_added(entity: Entity) -> bool:
+    """Return True if the entity platform added the entity to Home Assistant."""
+    # Entities that are disabled in the registry are never added, and
+    # add_to_platform_abort clears both hass and platform on them
+    return entity.hass is not None and entity.platform is not None
+
+
+def _features_for_commands(blocked_commands: list[str]) -> MediaPlayerEntityFeature:
+    """Return the features matching the blocked commands."""
+    features = MediaPlayerEntityFeature(0)
+    for command in blocked_commands:
+        features |= MediaPlayerEntityFeature[command.upper()]
+    return features
+
+
 class RestrictedMediaPlayer(MediaPlayerEntity):
     """Representation of a Restricted Media Player."""
 
@@ -57,14 +182,22 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
         base_entity_id: str,
         allowed_sources: list[str],
         name: str,
+        unique_id: str | None = None,
+        device_name: str | None = None,
+        blocked_commands: list[str] | None = None,
     ) -> None:
         """Initialize the Restricted Media Player."""
         self.hass = hass
         self._config_entry = config_entry
         self._base_entity_id = base_entity_id
         self._allowed_sources = allowed_sources
+        self._device_name = device_name or name
         self._attr_name = name
-        self._attr_unique_id = f"{config_entry.entry_id}"
+        self._attr_unique_id = unique_id or f"{config_entry.entry_id}"
+        self._blocked_features = _features_for_commands(blocked_commands or [])
+        self._base_features: int | None = None
+        self._supported_features = MediaPlayerEntityFeature(0)
+        self._unsub_base_entity: Callable[[], None] | None = None
 
         # Generate entity_id based on name
         entity_id_suffix = name.lower().replace(" ", "_")
@@ -279,28 +412,61 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
         """Flag media player features that are supported."""
-        base_state = self.hass.states.get(self._base_entity_id)
-        if not base_state:
-            return MediaPlayerEntityFeature(0)
+        return self._supported_features
 
-        base_features = base_state.attributes.get("supported_features", 0)
+    @callback
+    def _async_update_supported_features(self, base_state: State | None) -> None:
+        """Recalculate the supported features when the base features change."""
+        base_features = (
+            base_state.attributes.get("supported_features", 0) if base_state else 0
+        )
+        if base_features == self._base_features:
+            return
 
-        # Ensure SELECT_SOURCE is included if base supports it
-        if base_features & MediaPlayerEntityFeature.SELECT_SOURCE:
-            return MediaPlayerEntityFeature(base_features)
+        self._base_features = base_features
+        self._supported_features = (
+            MediaPlayerEntityFeature(base_features) & ~self._blocked_features
+        )
 
-        return MediaPlayerEntityFeature(base_features)
+    def _check_command(self, feature: MediaPlayerEntityFeature) -> None:
+        """Reject a command that is blocked on this entity."""
+        if feature & self._blocked_features:
+            raise HomeAssistantError(
+                f"{feature.name.lower()} is blocked on {self.entity_id}"
+            )
 
     @property
     def device_info(self):
         """Return device info for this virtual wrapper entity."""
         return {
             "identifiers": {(self._config_entry.domain, self._config_entry.entry_id)},
-            "name": self._attr_name,
+            "name": self._device_name,
             "manufacturer": "Restricted Media Player",
             "model": "Restricted Wrapper",
         }
 
+    @callback
+    def async_set_allowed_sources(self, allowed_sources: list[str]) -> None:
+        """Update the allowed sources without reloading the config entry."""
+        self._allowed_sources = allowed_sources
+        # Entities that are not added yet pick the sources up when they are
+        if _entity_added(self):
+            self.async_write_ha_state()
+
+    @callback
+    def async_set_blocked_commands(self, blocked_commands: list[str]) -> None:
+        """Update the blocked commands without writing state.
+
+        Supported features are recalculated when the entity is added, or
+        straight away if it already has been.
+        """
+        self._blocked_features = _features_for_commands(blocked_commands)
+        self._base_features = None
+        if _entity_added(self):
+            self._async_update_supported_features(
+                self.hass.states.get(self._base_entity_id)
+            )
+
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
         if source == TECHNICIAN_MODE_SOURCE:
@@ -324,6 +490,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_volume_up(self) -> None:
         """Volume up the media player."""
+        self._check_command(MediaPlayerEntityFeature.VOLUME_STEP)
         await self.hass.services.async_call(
             "media_player",
             "volume_up",
@@ -333,6 +500,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_volume_down(self) -> None:
         """Volume down the media player."""
+        self._check_command(MediaPlayerEntityFeature.VOLUME_STEP)
         await self.hass.services.async_call(
             "media_player",
             "volume_down",
@@ -342,6 +510,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
+        self._check_command(MediaPlayerEntityFeature.VOLUME_SET)
         await self.hass.services.async_call(
             "media_player",
             "volume_set",
@@ -354,6 +523,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute the volume."""
+        self._check_command(MediaPlayerEntityFeature.VOLUME_MUTE)
         await self.hass.services.async_call(
             "media_player",
             "volume_mute",
@@ -366,6 +536,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_media_play(self) -> None:
         """Send play command."""
+        self._check_command(MediaPlayerEntityFeature.PLAY)
         await self.hass.services.async_call(
             "media_player",
             "media_play",
@@ -375,6 +546,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
+        self._check_command(MediaPlayerEntityFeature.PAUSE)
         await self.hass.services.async_call(
             "media_player",
             "media_pause",
@@ -384,6 +556,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
+        self._check_command(MediaPlayerEntityFeature.STOP)
         await self.hass.services.async_call(
             "media_player",
             "media_stop",
@@ -393,6 +566,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
+        self._check_command(MediaPlayerEntityFeature.NEXT_TRACK)
         await self.hass.services.async_call(
             "media_player",
             "media_next_track",
@@ -402,6 +576,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
+        self._check_command(MediaPlayerEntityFeature.PREVIOUS_TRACK)
         await self.hass.services.async_call(
             "media_player",
             "media_previous_track",
@@ -411,6 +586,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_media_seek(self, position: float) -> None:
         """Send seek command."""
+        self._check_command(MediaPlayerEntityFeature.SEEK)
         await self.hass.services.async_call(
             "media_player",
             "media_seek",
@@ -425,6 +601,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
         self, media_type: str, media_id: str, **kwargs: Any
     ) -> None:
         """Play a piece of media."""
+        self._check_command(MediaPlayerEntityFeature.PLAY_MEDIA)
         await self.hass.services.async_call(
             "media_player",
             "play_media",
@@ -439,6 +616,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
+        self._check_command(MediaPlayerEntityFeature.TURN_ON)
         await self.hass.services.async_call(
             "media_player",
             "turn_on",
@@ -448,6 +626,7 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_turn_off(self) -> None:
         """Turn the media player off."""
+        self._check_command(MediaPlayerEntityFeature.TURN_OFF)
         await self.hass.services.async_call(
             "media_player",
             "turn_off",
@@ -457,6 +636,9 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_toggle(self) -> None:
         """Toggle the media player."""
+        # Toggling may turn the player on or off, so both must be allowed
+        self._check_command(MediaPlayerEntityFeature.TURN_ON)
+        self._check_command(MediaPlayerEntityFeature.TURN_OFF)
         await self.hass.services.async_call(
             "media_player",
             "toggle",
@@ -466,16 +648,38 @@ class RestrictedMediaPlayer(MediaPlayerEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added."""
+        self._async_update_supported_features(
+            self.hass.states.get(self._base_entity_id)
+        )
+
         # Track state changes of the base entity
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                self._base_entity_id,
-                self._async_base_entity_state_changed,
-            )
+        self._unsub_base_entity = async_track_state_change_event(
+            self.hass,
+            self._base_entity_id,
+            self._async_base_entity_state_changed,
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop tracking the base entity when entity is removed."""
+        if self._unsub_base_entity:
+            self._unsub_base_entity()
+            self._unsub_base_entity = None
+
+    @callback
+    def async_set_base_entity_handler(
+        self, action: Callable[[Event], None]
+    ) -> None:
+        """Replace the handler for base entity state changes."""
+        if self._unsub_base_entity is None:
+            return
+
+        self._unsub_base_entity()
+        self._unsub_base_entity = async_track_state_change_event(
+            self.hass, self._base_entity_id, action
         )
 
     @callback
     def _async_base_entity_state_changed(self, event) -> None:
         """Handle base entity state changes."""
+        self._async_update_supported_features(event.data["new_state"])
         self.async_write_ha_state()
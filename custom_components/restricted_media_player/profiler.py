@@ -0,0 +1,298 @@
+"""On-demand profiling for the Restricted Media Player integration."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from collections import defaultdict
+from collections.abc import Callable, Coroutine, Generator
+from dataclasses import dataclass
+import functools
+import json
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.util import dt as dt_util
+
+from .const import ATTR_CPROFILE, ATTR_DURATION, DOMAIN, SERVICE_PROFILE
+from .media_player import RestrictedMediaPlayer
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional(ATTR_CPROFILE, default=False): cv.boolean,
+    }
+)
+
+# Pass-through commands that forward a service call to the base entity
+PASSTHROUGH_COMMANDS = (
+    "async_select_source",
+    "async_volume_up",
+    "async_volume_down",
+    "async_set_volume_level",
+    "async_mute_volume",
+    "async_media_play",
+    "async_media_pause",
+    "async_media_stop",
+    "async_media_next_track",
+    "async_media_previous_track",
+    "async_media_seek",
+    "async_play_media",
+    "async_turn_on",
+    "async_turn_off",
+    "async_toggle",
+)
+
+# Methods shadowed on each entity instance while profiling. The base entity
+# handler is swapped on the state change subscription instead.
+# _async_write_ha_state evaluates the entity properties and writes the state.
+INSTANCE_METHODS = ("_async_write_ha_state", *PASSTHROUGH_COMMANDS)
+
+
+@dataclass
+class _CallStats:
+    """Timing statistics for a single function."""
+
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    latency: _CallStats | None = None
+
+    def record(self, elapsed: float) -> None:
+        """Record a single call."""
+        self.calls += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+    def record_latency(self, elapsed: float) -> None:
+        """Record the end to end duration of a single call."""
+        if self.latency is None:
+            self.latency = _CallStats()
+        self.latency.record(elapsed)
+
+    def merge(self, other: _CallStats) -> None:
+        """Fold another set of statistics into this one."""
+        self.calls += other.calls
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if other.latency is not None:
+            if self.latency is None:
+                self.latency = _CallStats()
+            self.latency.merge(other.latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in milliseconds."""
+        result: dict[str, Any] = {
+            "calls": self.calls,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+        if self.latency is not None:
+            result["latency_ms"] = self.latency.as_dict()
+        return result
+
+
+class _LoopTimer:
+    """Await a coroutine, timing only the steps that run on the event loop.
+
+    Time spent suspended, such as waiting for the base player's service
+    call, is not counted.
+    """
+
+    def __init__(self, coro: Coroutine[Any, Any, Any], stats: _CallStats) -> None:
+        """Initialize the timer."""
+        self._coro = coro
+        self._stats = stats
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        """Drive the wrapped coroutine one step at a time."""
+        coro = self._coro
+        elapsed = 0.0
+        value: Any = None
+        error: BaseException | None = None
+
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    if error is None:
+                        future = coro.send(value)
+                    else:
+                        future = coro.throw(error)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    elapsed += time.perf_counter() - start
+
+                value, error = None, None
+                try:
+                    value = yield future
+                except GeneratorExit:
+                    coro.close()
+                    raise
+                except BaseException as err:  # noqa: BLE001
+                    error = err
+        finally:
+            self._stats.record(elapsed)
+
+
+class _Instrumentation:
+    """Temporarily wrap the methods of live restricted players with timers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the instrumentation."""
+        self.hass = hass
+        self.stats: defaultdict[str, defaultdict[str, _CallStats]] = defaultdict(
+            lambda: defaultdict(_CallStats)
+        )
+        self._entities: list[RestrictedMediaPlayer] = []
+
+    def _wrap(
+        self, entity: RestrictedMediaPlayer, name: str, func: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Return a timed wrapper for a bound method of entity."""
+        stats = self.stats
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                call_stats = stats[entity.entity_id][name]
+                start = time.perf_counter()
+                try:
+                    return await _LoopTimer(func(*args, **kwargs), call_stats)
+                finally:
+                    call_stats.record_latency(time.perf_counter() - start)
+
+            return async_wrapper
+
+        @callback
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats[entity.entity_id][name].record(time.perf_counter() - start)
+
+        return wrapper
+
+    @callback
+    def async_install(self) -> None:
+        """Wrap the profiled methods of every live restricted player."""
+        for platform in async_get_platforms(self.hass, DOMAIN):
+            for entity in list(platform.entities.values()):
+                if isinstance(entity, RestrictedMediaPlayer):
+                    self._async_install_entity(entity)
+
+    @callback
+    def _async_install_entity(self, entity: RestrictedMediaPlayer) -> None:
+        """Wrap the profiled methods of a single entity."""
+        # Track the entity first so a partial install is still undone
+        self._entities.append(entity)
+        for name in INSTANCE_METHODS:
+            setattr(entity, name, self._wrap(entity, name, getattr(entity, name)))
+        entity.async_set_base_entity_handler(
+            self._wrap(
+                entity,
+                "_async_base_entity_state_changed",
+                entity._async_base_entity_state_changed,
+            )
+        )
+
+    @callback
+    def async_uninstall(self) -> None:
+        """Restore the original methods of every wrapped entity."""
+        for entity in self._entities:
+            for name in INSTANCE_METHODS:
+                entity.__dict__.pop(name, None)
+            entity.async_set_base_entity_handler(
+                entity._async_base_entity_state_changed
+            )
+        self._entities.clear()
+
+    def summary(self) -> dict[str, Any]:
+        """Return the collected statistics per entity and per function."""
+        functions: defaultdict[str, _CallStats] = defaultdict(_CallStats)
+        entities: dict[str, dict[str, Any]] = {}
+
+        for entity_id, entity_stats in sorted(self.stats.items()):
+            entities[entity_id] = {}
+            for name, call_stats in sorted(entity_stats.items()):
+                entities[entity_id][name] = call_stats.as_dict()
+                functions[name].merge(call_stats)
+
+        return {
+            "functions": {
+                name: call_stats.as_dict()
+                for name, call_stats in sorted(functions.items())
+            },
+            "entities": entities,
+        }
+
+
+def _write_summary(path: str, summary: dict[str, Any]) -> None:
+    """Write the profiling summary to disk."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=2)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the profiling service."""
+    lock = asyncio.Lock()
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the restricted media players for a bounded window."""
+        if lock.locked():
+            raise HomeAssistantError("A profiling window is already running")
+
+        async with lock:
+            duration: float = call.data[ATTR_DURATION]
+            started = dt_util.utcnow()
+            timestamp = started.strftime("%Y%m%d_%H%M%S")
+
+            instrumentation = _Instrumentation(hass)
+            profiler = cProfile.Profile() if call.data[ATTR_CPROFILE] else None
+
+            _LOGGER.info("Profiling restricted media players for %s seconds", duration)
+
+            try:
+                instrumentation.async_install()
+                if profiler:
+                    profiler.enable()
+                await asyncio.sleep(duration)
+            finally:
+                if profiler:
+                    profiler.disable()
+                instrumentation.async_uninstall()
+
+            summary = {
+                "started": started.isoformat(),
+                "duration": duration,
+                **instrumentation.summary(),
+            }
+
+            summary_path = hass.config.path(f"{DOMAIN}_profile_{timestamp}.json")
+            await hass.async_add_executor_job(_write_summary, summary_path, summary)
+            _LOGGER.info("Wrote profiling summary to %s", summary_path)
+
+            if profiler:
+                cprofile_path = hass.config.path(f"{DOMAIN}_profile_{timestamp}.cprof")
+                await hass.async_add_executor_job(profiler.dump_stats, cprofile_path)
+                _LOGGER.info("Wrote cProfile statistics to %s", cprofile_path)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA
+    )
@@ -0,0 +1,90 @@
+"""Check that the profiling instrumentation times a real state write.
+
+Sets up one restricted media player inside Home Assistant's test harness,
+opens a profiling window, changes the base player once and asserts that the
+base entity handler and the state write were both timed. After the window
+closes a further change must not be recorded.
+
+Requires pytest-homeassistant-custom-component:
+
+    pip install pytest-homeassistant-custom-component
+    python scripts/profile_check.py
+"""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from homeassistant import loader
+from homeassistant.const import STATE_PAUSED, STATE_PLAYING
+from homeassistant.setup import async_setup_component
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from custom_components.restricted_media_player.const import (  # noqa: E402
+    CONF_ALLOWED_SOURCES,
+    CONF_BASE_ENTITY,
+    CONF_NAME,
+    DOMAIN,
+)
+from custom_components.restricted_media_player.profiler import (  # noqa: E402
+    _Instrumentation,
+)
+
+BASE_ENTITY_ID = "media_player.profile_check_base"
+ENTITY_ID = "media_player.profile_check_restricted"
+BASE_ATTRIBUTES = {"source_list": ["Netflix", "HDMI 1"], "source": "Netflix"}
+
+TIMED_FUNCTIONS = ("_async_base_entity_state_changed", "_async_write_ha_state")
+
+
+async def async_check() -> None:
+    """Run the check."""
+    async with async_test_home_assistant() as hass:
+        # Load the integration from this checkout
+        hass.config.config_dir = str(REPO_ROOT)
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+        hass.states.async_set(BASE_ENTITY_ID, STATE_PLAYING, BASE_ATTRIBUTES)
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_BASE_ENTITY: BASE_ENTITY_ID,
+                CONF_ALLOWED_SOURCES: ["Netflix"],
+                CONF_NAME: "Profile Check Restricted",
+            },
+        ).add_to_hass(hass)
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+
+        instrumentation = _Instrumentation(hass)
+        instrumentation.async_install()
+        try:
+            hass.states.async_set(BASE_ENTITY_ID, STATE_PAUSED, BASE_ATTRIBUTES)
+            await hass.async_block_till_done()
+        finally:
+            instrumentation.async_uninstall()
+
+        stats = instrumentation.stats[ENTITY_ID]
+        for name in TIMED_FUNCTIONS:
+            assert stats[name].calls == 1, f"{name} was called {stats[name].calls} times"
+
+        hass.states.async_set(BASE_ENTITY_ID, STATE_PLAYING, BASE_ATTRIBUTES)
+        await hass.async_block_till_done()
+
+        for name in TIMED_FUNCTIONS:
+            assert stats[name].calls == 1, f"{name} was timed after the window closed"
+        assert hass.states.get(ENTITY_ID).state == STATE_PLAYING
+
+    print("Profiling instrumentation OK")
+
+
+if __name__ == "__main__":
+    asyncio.run(async_check())
@@ -0,0 +1,367 @@
+"""Soak harness for the Restricted Media Player integration.
+
+Sets up a large fleet of restricted media players over fake base media
+players, either one config entry each or grouped into site entries, inside
+Home Assistant's test harness. Drives a mix of base player events at a
+fixed rate and reports event loop lag, state writes per second and memory
+growth per wrapper.
+
+Requires pytest-homeassistant-custom-component:
+
+    pip install pytest-homeassistant-custom-component
+    python scripts/soak.py --entries 1000 --rate 2000 --duration 300 --trace-memory
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+import homeassistant
+from homeassistant import loader
+from homeassistant.components.media_player import MediaPlayerEntityFeature
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_PLAYING, STATE_UNAVAILABLE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from custom_components.restricted_media_player.const import (  # noqa: E402
+    CONF_ALLOWED_SOURCES,
+    CONF_BASE_ENTITY,
+    CONF_ENTITIES,
+    CONF_NAME,
+    DOMAIN,
+)
+
+SOURCES = ["Netflix", "YouTube", "HDMI 1", "HDMI 2", "Bluetooth", "AUX"]
+ALLOWED_SOURCES = ["Netflix", "YouTube"]
+BASE_FEATURES = (
+    MediaPlayerEntityFeature.SELECT_SOURCE
+    | MediaPlayerEntityFeature.VOLUME_SET
+    | MediaPlayerEntityFeature.VOLUME_MUTE
+    | MediaPlayerEntityFeature.PLAY
+    | MediaPlayerEntityFeature.PAUSE
+    | MediaPlayerEntityFeature.TURN_ON
+    | MediaPlayerEntityFeature.TURN_OFF
+)
+
+MEMORY_FILTERS = [
+    tracemalloc.Filter(True, str(REPO_ROOT / "custom_components" / "*")),
+    tracemalloc.Filter(True, str(Path(homeassistant.__file__).parent / "*")),
+]
+
+LAG_INTERVAL = 0.05
+DRIVER_INTERVAL = 0.01
+
+
+@dataclass
+class SoakResults:
+    """Measurements collected during a soak run."""
+
+    lag: list[float] = field(default_factory=list)
+    base_events: int = 0
+    wrapper_writes: int = 0
+    events_by_kind: dict[str, int] = field(
+        default_factory=lambda: {"position": 0, "source": 0, "availability": 0}
+    )
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    """Return the given percentile of samples using nearest rank."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _base_entity_id(index: int) -> str:
+    """Return the entity id of a fake base player."""
+    return f"media_player.soak_base_{index}"
+
+
+def _base_attributes(source: str, position: int) -> dict[str, Any]:
+    """Return the attributes of a fake base player."""
+    return {
+        "friendly_name": "Soak Base",
+        "source_list": SOURCES,
+        "source": source,
+        "supported_features": BASE_FEATURES,
+        "volume_level": 0.5,
+        "is_volume_muted": False,
+        "media_title": "Soak",
+        "media_duration": 3600,
+        "media_position": position,
+        "media_position_updated_at": dt_util.utcnow(),
+    }
+
+
+class FleetDriver:
+    """Drive a realistic mix of events on the fake base players."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entries: int,
+        weights: dict[str, float],
+        seed: int,
+    ) -> None:
+        """Initialize the driver."""
+        self.hass = hass
+        self._random = random.Random(seed)
+        self._kinds = list(weights)
+        self._weights = list(weights.values())
+        self._sources = [ALLOWED_SOURCES[0]] * entries
+        self._positions = [0] * entries
+        self._available = [True] * entries
+
+    @callback
+    def async_create_bases(self) -> None:
+        """Create the initial base player states."""
+        for index in range(len(self._sources)):
+            self.hass.states.async_set(
+                _base_entity_id(index),
+                STATE_PLAYING,
+                _base_attributes(self._sources[index], 0),
+            )
+
+    @callback
+    def async_fire(self, results: SoakResults) -> None:
+        """Apply a single random event to a random base player."""
+        index = self._random.randrange(len(self._sources))
+        kind = self._random.choices(self._kinds, self._weights)[0]
+
+        if kind == "position":
+            self._positions[index] += 1
+        elif kind == "source":
+            self._sources[index] = self._random.choice(SOURCES)
+        else:
+            self._available[index] = not self._available[index]
+
+        self.hass.states.async_set(
+            _base_entity_id(index),
+            STATE_PLAYING if self._available[index] else STATE_UNAVAILABLE,
+            _base_attributes(self._sources[index], self._positions[index]),
+        )
+        results.events_by_kind[kind] += 1
+        results.base_events += 1
+
+
+async def _async_monitor_lag(results: SoakResults) -> None:
+    """Sample how late the event loop wakes up a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        results.lag.append(max(0.0, loop.time() - expected))
+
+
+async def _async_drive(
+    driver: FleetDriver, results: SoakResults, rate: float, duration: float
+) -> None:
+    """Fire base events at the requested rate for the requested duration."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    sent = 0
+    while (elapsed := loop.time() - start) < duration:
+        due = int(rate * elapsed) - sent
+        for _ in range(due):
+            driver.async_fire(results)
+        sent += due
+        await asyncio.sleep(DRIVER_INTERVAL)
+
+
+async def async_soak(args: argparse.Namespace) -> dict[str, Any]:
+    """Run a soak and return the report."""
+    results = SoakResults()
+    weights = {
+        "position": args.position_weight,
+        "source": args.source_weight,
+        "availability": args.availability_weight,
+    }
+
+    async with async_test_home_assistant() as hass:
+        # Load the integration from this checkout
+        hass.config.config_dir = str(REPO_ROOT)
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+        driver = FleetDriver(hass, args.entries, weights, args.seed)
+        driver.async_create_bases()
+        base_entity_ids = {_base_entity_id(index) for index in range(args.entries)}
+
+        rows = [
+            {
+                CONF_BASE_ENTITY: _base_entity_id(index),
+                CONF_ALLOWED_SOURCES: ALLOWED_SOURCES,
+                CONF_NAME: f"Soak Restricted {index}",
+            }
+            for index in range(args.entries)
+        ]
+        if args.site_size:
+            # Group the rows into site entries
+            for start in range(0, args.entries, args.site_size):
+                site_name = f"Soak Site {start // args.site_size}"
+                MockConfigEntry(
+                    domain=DOMAIN,
+                    title=site_name,
+                    data={
+                        CONF_NAME: site_name,
+                        CONF_ENTITIES: rows[start : start + args.site_size],
+                    },
+                ).add_to_hass(hass)
+        else:
+            for index, row in enumerate(rows):
+                MockConfigEntry(
+                    domain=DOMAIN, title=f"Soak {index}", data=row
+                ).add_to_hass(hass)
+
+        if args.trace_memory:
+            tracemalloc.start()
+            memory_before_setup = _integration_memory()
+
+        setup_start = time.perf_counter()
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+        setup_time = time.perf_counter() - setup_start
+
+        if args.trace_memory:
+            memory_after_setup = _integration_memory()
+            tracemalloc.stop()
+
+        # Measure lag and writes without tracemalloc slowing the loop
+        @callback
+        def _async_count_write(event: Event) -> None:
+            """Count state writes made by the restricted players."""
+            entity_id = event.data["entity_id"]
+            if entity_id.startswith("media_player.") and entity_id not in base_entity_ids:
+                results.wrapper_writes += 1
+
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _async_count_write)
+        monitor = hass.async_create_background_task(
+            _async_monitor_lag(results), "soak lag monitor"
+        )
+
+        soak_start = time.perf_counter()
+        await _async_drive(driver, results, args.rate, args.duration)
+        await hass.async_block_till_done()
+        soak_time = time.perf_counter() - soak_start
+
+        monitor.cancel()
+        unsub()
+
+        if args.trace_memory:
+            # Soak again under tracemalloc, counting only allocations made by
+            # the integration and Home Assistant rather than by this harness
+            tracemalloc.start()
+            memory_before_soak = _integration_memory()
+            await _async_drive(driver, SoakResults(), args.rate, args.duration)
+            await hass.async_block_till_done()
+            memory_after_soak = _integration_memory()
+            tracemalloc.stop()
+
+    report: dict[str, Any] = {
+        "entries": args.entries,
+        "site_size": args.site_size,
+        "rate": args.rate,
+        "duration": round(soak_time, 1),
+        "setup_seconds": round(setup_time, 2),
+        "base_events": results.base_events,
+        "events_by_kind": results.events_by_kind,
+        "base_events_per_second": round(results.base_events / soak_time, 1),
+        "wrapper_writes": results.wrapper_writes,
+        "wrapper_writes_per_second": round(results.wrapper_writes / soak_time, 1),
+        "loop_lag_ms": {
+            f"p{percentile}": round(_percentile(results.lag, percentile) * 1000, 2)
+            for percentile in (50, 90, 99)
+        }
+        | {"max": round(max(results.lag, default=0.0) * 1000, 2)},
+    }
+
+    if args.trace_memory:
+        report["memory_bytes_per_wrapper"] = {
+            "setup": round((memory_after_setup - memory_before_setup) / args.entries),
+            "growth": round((memory_after_soak - memory_before_soak) / args.entries),
+        }
+
+    return report
+
+
+def _integration_memory() -> int:
+    """Return the traced memory allocated by the integration and Home Assistant."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(MEMORY_FILTERS)
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def _positive_int(value: str) -> int:
+    """Parse an integer greater than zero."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    """Parse an integer of zero or more."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a non-negative integer")
+    return number
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=_positive_int, default=400, help="restricted entities")
+    parser.add_argument(
+        "--site-size",
+        type=_non_negative_int,
+        default=0,
+        help="group entities into site entries of this many rows, 0 for one entry each",
+    )
+    parser.add_argument(
+        "--rate", type=_positive_int, default=500, help="base events per second, fleet wide"
+    )
+    parser.add_argument("--duration", type=float, default=120, help="seconds to soak")
+    parser.add_argument("--position-weight", type=float, default=0.85)
+    parser.add_argument("--source-weight", type=float, default=0.1)
+    parser.add_argument("--availability-weight", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="trace setup and run a second soak phase to measure memory per wrapper",
+    )
+    parser.add_argument("--json", type=Path, help="also write the report to a file")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the soak harness."""
+    args = _parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    report = asyncio.run(async_soak(args))
+
+    print(json.dumps(report, indent=2))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()